@@ -1,5 +1,8 @@
 """
 ANCA Agent Modules
+
+The node factories are memoised: a compiled agent holds no per-run state, so
+each one is built once per process and shared by every caller.
 """
 from .researcher import create_researcher_node
 from .generator import create_generator_node
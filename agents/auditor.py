@@ -2,14 +2,12 @@
 SEO Auditor Node (LangGraph)
 Critiques content and provides feedback.
 """
-import os
 import logging
-from typing import List
-from langchain_ollama import ChatOllama
+from functools import lru_cache
 from langgraph.prebuilt import create_react_agent
 from langchain_core.tools import tool
 
-from app.core.langchain_logging_callback import LangChainLoggingHandler
+from app.core.ollama_clients import AUDIT_NUM_CTX, AUDIT_NUM_PREDICT, REVIEW_MODEL, get_agent_config, get_chat_ollama
 from tools.file_reader_tool import FileReaderTool
 
 logger = logging.getLogger(__name__)
@@ -46,17 +44,14 @@ AUDITOR_SYSTEM_PROMPT = """You are an autonomous SEO auditor agent. You MUST fol
 BEGIN EXECUTION NOW. NO TEXT. ONLY TOOL CALLS."""
 
 # --- Node Factory ---
+@lru_cache(maxsize=None)
 def create_auditor_node():
     """Create the Auditor agent as a LangGraph node."""
 
     # 1. Setup LLM
-    llm = ChatOllama(
-        model="qwen2.5:7b-instruct",
-        base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
-        temperature=0.3,  # Low temp for critical analysis
-        num_ctx=10240,
-        callbacks=[LangChainLoggingHandler(agent_name="SEO Auditor")]
-    )
+    llm = get_chat_ollama(
+        0.3, model=REVIEW_MODEL, num_ctx=AUDIT_NUM_CTX, num_predict=AUDIT_NUM_PREDICT
+    )  # Low temp for critical analysis
 
     # 2. Define Tools
     # Auditor NEEDS to read the file to critique it properly
@@ -67,6 +62,6 @@ def create_auditor_node():
         llm,
         tools,
         prompt=AUDITOR_SYSTEM_PROMPT
-    )
+    ).with_config(get_agent_config("SEO Auditor"))
 
     return agent
@@ -2,23 +2,22 @@
 QA Critique Node (LangGraph)
 Evaluates article quality and length, with access to RAG and Search for content expansion.
 """
-import os
 import logging
-from langchain_ollama import ChatOllama
+from functools import lru_cache
 from langgraph.prebuilt import create_react_agent
 from langchain_core.tools import tool
 
-from app.core.langchain_logging_callback import LangChainLoggingHandler
+from app.core.ollama_clients import REVIEW_MODEL, get_agent_config, get_chat_ollama
 from tools.file_reader_tool import FileReaderTool
 from tools.word_count_tool import calculate_word_count
-from tools.rag_tool import RAGTool
+from tools.rag_tool import get_rag_tool
 from tools.search_tool import web_search
 
 logger = logging.getLogger(__name__)
 
 # --- Tool Wrappers ---
 file_reader = FileReaderTool()
-rag = RAGTool()
+rag = get_rag_tool()
 
 
 @tool
@@ -65,17 +64,12 @@ BEGIN EXECUTION NOW. NO TEXT. ONLY TOOL CALLS."""
 
 
 # --- Node Factory ---
+@lru_cache(maxsize=None)
 def create_critique_node():
     """Create the Critique agent as a LangGraph node."""
 
     # 1. Setup LLM
-    llm = ChatOllama(
-        model="qwen2.5:7b-instruct",
-        base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
-        temperature=0.2,  # Low temp for consistent evaluation
-        num_ctx=10240,
-        callbacks=[LangChainLoggingHandler(agent_name="QA Critique")]
-    )
+    llm = get_chat_ollama(0.2, model=REVIEW_MODEL)  # Low temp for consistent evaluation
 
     # 2. Define Tools - includes RAG and Search for content expansion
     tools = [read_file, calculate_word_count, retrieve_context, web_search]
@@ -85,6 +79,6 @@ def create_critique_node():
         llm,
         tools,
         prompt=CRITIQUE_SYSTEM_PROMPT
-    )
+    ).with_config(get_agent_config("QA Critique"))
 
     return agent
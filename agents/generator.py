@@ -2,23 +2,26 @@
 Content Generator Node (LangGraph)
 Uses native tool calling to write and save articles.
 """
-import os
 import logging
-from typing import List
-from langchain_ollama import ChatOllama
+import re
+import threading
+from collections import OrderedDict
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional
 from langgraph.prebuilt import create_react_agent
 from langchain_core.tools import tool
 
-from app.core.langchain_logging_callback import LangChainLoggingHandler
+from app.core.ollama_clients import get_agent_config, get_chat_ollama
 from tools.file_writer_tool import FileWriterTool
-from tools.rag_tool import RAGTool
+from tools.rag_tool import get_rag_tool
 from tools.file_reader_tool import FileReaderTool
 
 logger = logging.getLogger(__name__)
 
 # --- Tool Wrappers ---
 file_writer = FileWriterTool()
-rag = RAGTool()
+rag = get_rag_tool()
 file_reader = FileReaderTool()
 
 @tool
@@ -28,21 +31,40 @@ def save_article(filename: str, content: str):
         return "Error: Content too short to save."
     return file_writer._run(filename=filename, content=content)
 
-@tool
-def retrieve_context(query: str):
-    """Retrieve relevant context/facts from the knowledge base using a search query."""
-    return rag._run(action="retrieve", query=query)
-
-seen_queries = set()
+# Queries already retrieved in the current generator run, oldest first and
+# capped at MAX_SEEN. A ContextVar keeps concurrent runs apart; the lock guards
+# the history shared by parallel tool calls. Callers that never call
+# reset_seen_queries() (run_crew, direct agent use) share the process-wide
+# fallback history instead.
+MAX_SEEN = 512
+_default_seen_queries: "OrderedDict[str, None]" = OrderedDict()
+_seen_queries: ContextVar[Optional["OrderedDict[str, None]"]] = ContextVar("seen_queries", default=None)
+_seen_queries_lock = threading.Lock()
+_QUERY_TOKEN_RE = re.compile(r"\w+")
+
+def reset_seen_queries():
+    """Start a fresh query history for a new generator run."""
+    _seen_queries.set(OrderedDict())
+
+def _query_signature(query: str) -> str:
+    """Case, punctuation and word-order insensitive form of a query."""
+    return " ".join(sorted(set(_QUERY_TOKEN_RE.findall(query.lower()))))
 
 @tool
 def retrieve_context(query: str):
     """Retrieve relevant context/facts from the knowledge base using a search query."""
-    # Normalize to prevent case/whitespace bypass
-    q = query.strip().lower()
-    if q in seen_queries:
-        return f"SYSTEM NOTE: You have already searched for '{query}'. Do NOT search it again. Use a different query to retrieve the content need."
-    seen_queries.add(q)
+    # Normalize to prevent case/punctuation/word-order bypass
+    q = _query_signature(query)
+    seen_queries = _seen_queries.get()
+    if seen_queries is None:
+        # Setting it here would only last for this tool call's copied context
+        seen_queries = _default_seen_queries
+    with _seen_queries_lock:
+        if q in seen_queries:
+            return f"SYSTEM NOTE: You have already searched for '{query}'. Do NOT search it again. Use a different query to retrieve the content need."
+        seen_queries[q] = None
+        if len(seen_queries) > MAX_SEEN:
+            seen_queries.popitem(last=False)
     return rag._run(action="retrieve", query=query)
 
 @tool
@@ -77,17 +99,12 @@ GENERATOR_SYSTEM_PROMPT = """You are an autonomous content generation agent. You
 BEGIN EXECUTION NOW. NO TEXT. ONLY TOOL CALLS."""
 
 # --- Node Factory ---
+@lru_cache(maxsize=None)
 def create_generator_node():
     """Create the Generator agent as a LangGraph node."""
 
     # 1. Setup LLM
-    llm = ChatOllama(
-        model="qwen2.5:7b-instruct",
-        base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
-        temperature=0.7,
-        num_ctx=10240,
-        callbacks=[LangChainLoggingHandler(agent_name="Content Generator")]
-    )
+    llm = get_chat_ollama(0.7)
 
     # 2. Define Tools
     # Note: retrieval only, ingestion is done by Researcher
@@ -98,6 +115,6 @@ def create_generator_node():
         llm,
         tools,
         prompt=GENERATOR_SYSTEM_PROMPT
-    )
+    ).with_config(get_agent_config("Content Generator"))
 
     return agent
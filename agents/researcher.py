@@ -2,36 +2,76 @@
 Market Researcher Node (LangGraph)
 Uses native tool calling to find and verify sources.
 """
-import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Annotated
-from langchain_ollama import ChatOllama
+from urllib.parse import urldefrag, urlparse
 from langchain_core.messages import SystemMessage, HumanMessage
 from langgraph.prebuilt import create_react_agent
 from langchain_core.tools import tool
 
-from app.core.langchain_logging_callback import LangChainLoggingHandler
-from tools.search_tool import web_search
+from app.core.ollama_clients import get_agent_config, get_chat_ollama
+from tools.search_tool import web_search, web_search_many
 from tools.scraper_tool import ScraperTool
 
-from tools.rag_tool import RAGTool
+from tools.rag_tool import get_rag_tool
 
 logger = logging.getLogger(__name__)
 
 # --- Tool Wrappers ---
 scraper = ScraperTool()
-rag = RAGTool()
+rag = get_rag_tool()
+
+# The researcher only needs a preview to judge a page; full content is cached for
+# ingestion, and the preview reports the page's total word count
+SCRAPE_PREVIEW_CHARS = 3000
 
 @tool
 def scrape_website(url: str):
     """Scrape content from a website URL. Use this to verify if a URL is good."""
-    return scraper._run(url)
+    return scraper._run(url, max_chars=SCRAPE_PREVIEW_CHARS)
 
 @tool
 def ingest_content(url: str):
     """Ingest a URL into the RAG knowledge base. Use this for EVERY good URL you find."""
     return rag._run(action="ingest", url=url)
 
+# Domains scraped concurrently by scrape_many
+MAX_PARALLEL_SCRAPES = 4
+
+def _dedupe_urls(urls: List[str]) -> List[str]:
+    """Unique URLs in order; overlapping searches often return the same page, sometimes with a #fragment."""
+    return list(dict.fromkeys(urldefrag(url.strip()).url for url in urls if url and url.strip()))
+
+def _scrape_domain(urls: List[str]) -> List[tuple]:
+    """Scrape one domain's URLs in order so its crawl delay is still respected."""
+    return [(url, scraper._run(url, max_chars=SCRAPE_PREVIEW_CHARS)) for url in urls]
+
+@tool
+def scrape_many(urls: List[str]):
+    """Scrape several URLs at once and return a preview of each page. Use this to verify which URLs are good before ingesting them."""
+    urls = _dedupe_urls(urls)
+
+    # Group by domain: different sites are scraped in parallel, same-site URLs sequentially
+    by_domain = {}
+    for url in urls:
+        by_domain.setdefault(urlparse(url).netloc, []).append(url)
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_SCRAPES) as executor:
+        scraped = dict(
+            pair
+            for domain_results in executor.map(_scrape_domain, by_domain.values())
+            for pair in domain_results
+        )
+
+    return "\n\n".join(scraped[url] for url in urls)
+
+@tool
+def ingest_many(urls: List[str]):
+    """Ingest several already-scraped URLs into the RAG knowledge base at once. Only pass URLs whose preview showed substantial, relevant content."""
+    return rag.ingest_batch(_dedupe_urls(urls))
+
 # --- System Prompt for Tool-First Execution ---
 RESEARCHER_SYSTEM_PROMPT = """You are an autonomous research agent. You MUST follow these rules STRICTLY:
 
@@ -56,26 +96,21 @@ Your response should IMMEDIATELY start with a tool call. Example:
 BEGIN EXECUTION NOW. NO TEXT. ONLY TOOL CALLS."""
 
 # --- Node Factory ---
+@lru_cache(maxsize=None)
 def create_researcher_node():
     """Create the Researcher agent as a LangGraph node."""
 
     # 1. Setup LLM
-    llm = ChatOllama(
-        model="qwen2.5:7b-instruct",
-        base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
-        temperature=0.3,  # Lower temperature for more deterministic tool use
-        num_ctx=10240,
-        callbacks=[LangChainLoggingHandler(agent_name="Market Researcher")]
-    )
+    llm = get_chat_ollama(0.3)  # Lower temperature for more deterministic tool use
 
     # 2. Define Tools
-    tools = [web_search, scrape_website, ingest_content]
+    tools = [web_search, web_search_many, scrape_website, scrape_many, ingest_content, ingest_many]
 
     # 3. Create Agent with system prompt for tool-first behavior
     agent = create_react_agent(
         llm,
         tools,
         prompt=RESEARCHER_SYSTEM_PROMPT
-    )
+    ).with_config(get_agent_config("Market Researcher"))
 
     return agent
@@ -3,13 +3,12 @@ SEO Reviser Node (LangGraph)
 Revises articles based on SEO auditor feedback. Focused on formatting, keywords, and structure.
 Does NOT handle content expansion (that's the Critique agent's job).
 """
-import os
 import logging
-from langchain_ollama import ChatOllama
+from functools import lru_cache
 from langgraph.prebuilt import create_react_agent
 from langchain_core.tools import tool
 
-from app.core.langchain_logging_callback import LangChainLoggingHandler
+from app.core.ollama_clients import get_agent_config, get_chat_ollama
 from tools.file_writer_tool import FileWriterTool
 from tools.file_reader_tool import FileReaderTool
 
@@ -70,17 +69,12 @@ BEGIN EXECUTION NOW. NO TEXT. ONLY TOOL CALLS."""
 
 
 # --- Node Factory ---
+@lru_cache(maxsize=None)
 def create_seo_reviser_node():
     """Create the SEO Reviser agent as a LangGraph node."""
 
     # 1. Setup LLM
-    llm = ChatOllama(
-        model="qwen2.5:7b-instruct",
-        base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
-        temperature=0.3,  # Low creativity for SEO fixes
-        num_ctx=10240,
-        callbacks=[LangChainLoggingHandler(agent_name="SEO Reviser")]
-    )
+    llm = get_chat_ollama(0.3)  # Low creativity for SEO fixes
 
     # 2. Define Tools - NO RAG/Search, SEO fixes only
     tools = [save_article, read_file]
@@ -90,7 +84,7 @@ def create_seo_reviser_node():
         llm,
         tools,
         prompt=SEO_REVISER_SYSTEM_PROMPT
-    )
+    ).with_config(get_agent_config("SEO Reviser"))
 
     return agent
 
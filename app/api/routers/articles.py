@@ -4,7 +4,11 @@ Article Management Routes
 from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import FileResponse
 from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Tuple
+import asyncio
 import logging
+import os
 
 from app.core.config import settings
 from app.schemas.models import ArticleListResponse, ArticleInfo, ErrorResponse
@@ -23,19 +27,35 @@ async def list_articles():
     if not settings.articles_dir.exists():
         return ArticleListResponse(articles=[], total=0)
     
-    articles = []
-    for file in settings.articles_dir.glob("*.md"):
-        stat = file.stat()
-        articles.append(ArticleInfo(
-            filename=file.name,
+    # Directory scan and stats are blocking syscalls; keep them off the event loop
+    entries = await asyncio.to_thread(_scan_articles, settings.articles_dir)
+    # Fields come straight from os.stat, so skip model validation
+    articles = [
+        ArticleInfo.model_construct(
+            filename=name,
             size=stat.st_size,
             created=datetime.fromtimestamp(stat.st_ctime),
             modified=datetime.fromtimestamp(stat.st_mtime)
-        ))
+        )
+        for name, stat in entries
+    ]
     
     return ArticleListResponse(articles=articles, total=len(articles))
 
 
+def iter_article_entries(directory: Path) -> Iterator[os.DirEntry]:
+    """Yield the markdown articles in one directory pass (file type comes from readdir)."""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".md") and entry.is_file():
+                yield entry
+
+
+def _scan_articles(directory: Path) -> List[Tuple[str, os.stat_result]]:
+    """Return (filename, stat) for every markdown article in one directory pass."""
+    return [(entry.name, entry.stat()) for entry in iter_article_entries(directory)]
+
+
 @router.get(
     "/articles/{filename}",
     response_class=FileResponse,
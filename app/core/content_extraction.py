@@ -10,6 +10,21 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# --- Precompiled Patterns ---
+_MARKDOWN_BLOCK_RE = re.compile(r'```markdown\s*(.*?)\s*```', re.DOTALL | re.IGNORECASE)
+_CODE_BLOCK_RE = re.compile(r'```\s*(.*?)\s*```', re.DOTALL)
+_FINAL_ANSWER_RES = [
+    re.compile(pattern, re.DOTALL | re.IGNORECASE)
+    for pattern in (
+        r'Final Answer:\s*(.*)',
+        r'Here is the article:\s*(.*)',
+        r'Article content:\s*(.*)',
+    )
+]
+_INSERT_RE = re.compile(r'\[insert.*?\]', re.IGNORECASE)
+_PLACEHOLDER_RE = re.compile(r'\[placeholder.*?\]', re.IGNORECASE)
+_TRAILING_REACT_RE = re.compile(r'\n\s*(Thought|Action):.*$', re.DOTALL)
+
 
 def extract_markdown_from_text(text: str) -> Optional[str]:
     """
@@ -26,7 +41,7 @@ def extract_markdown_from_text(text: str) -> Optional[str]:
         return None
     
     # Strategy 1: Look for markdown between triple backticks
-    markdown_blocks = re.findall(r'```markdown\s*(.*?)\s*```', text, re.DOTALL | re.IGNORECASE)
+    markdown_blocks = _MARKDOWN_BLOCK_RE.findall(text)
     if markdown_blocks:
         # Return the longest block
         longest = max(markdown_blocks, key=len)
@@ -35,7 +50,7 @@ def extract_markdown_from_text(text: str) -> Optional[str]:
             return longest.strip()
     
     # Strategy 2: Look for content between any triple backticks
-    any_code_blocks = re.findall(r'```\s*(.*?)\s*```', text, re.DOTALL)
+    any_code_blocks = _CODE_BLOCK_RE.findall(text)
     for block in any_code_blocks:
         # Check if it looks like markdown (has # headers)
         if '#' in block and len(block.strip()) > 200:
@@ -43,19 +58,13 @@ def extract_markdown_from_text(text: str) -> Optional[str]:
             return block.strip()
     
     # Strategy 3: Extract everything after "Final Answer:" or similar
-    final_answer_patterns = [
-        r'Final Answer:\s*(.*)',
-        r'Here is the article:\s*(.*)',
-        r'Article content:\s*(.*)',
-    ]
-    
-    for pattern in final_answer_patterns:
-        match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    for pattern in _FINAL_ANSWER_RES:
+        match = pattern.search(text)
         if match:
             content = match.group(1).strip()
             # Check if it starts with markdown header
             if content.startswith('#') and len(content) > 200:
-                logger.info(f"Extracted content after '{pattern}' ({len(content)} chars)")
+                logger.info(f"Extracted content after '{pattern.pattern}' ({len(content)} chars)")
                 return content
     
     # Strategy 4: Look for large block starting with # header
@@ -97,10 +106,10 @@ def clean_extracted_content(content: str) -> str:
         return content
     
     # Remove common artifacts
-    content = re.sub(r'\[insert.*?\]', '', content, flags=re.IGNORECASE)
-    content = re.sub(r'\[placeholder.*?\]', '', content, flags=re.IGNORECASE)
+    content = _INSERT_RE.sub('', content)
+    content = _PLACEHOLDER_RE.sub('', content)
     
     # Remove trailing "Thought:" or "Action:" if present
-    content = re.sub(r'\n\s*(Thought|Action):.*$', '', content, flags=re.DOTALL)
+    content = _TRAILING_REACT_RE.sub('', content)
     
     return content.strip()
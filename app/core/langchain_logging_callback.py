@@ -3,6 +3,7 @@ LangChain callback handler for logging LLM interactions.
 Adapts LangChain events to our existing logger.
 """
 import logging
+import threading
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 from langchain_core.callbacks import BaseCallbackHandler
@@ -18,7 +19,10 @@ class LangChainLoggingHandler(BaseCallbackHandler):
     def __init__(self, agent_name: str = "Unknown"):
         self.llm_logger = get_llm_call_logger()
         self.agent_name = agent_name
-        self.current_request_id = None
+        # One handler is shared by every run of an agent, so in-flight request
+        # IDs are tracked per LangChain run_id rather than on the instance.
+        self._request_ids: Dict[UUID, str] = {}
+        self._lock = threading.Lock()
         
     def on_chat_model_start(
         self,
@@ -32,17 +36,19 @@ class LangChainLoggingHandler(BaseCallbackHandler):
         **kwargs: Any,
     ) -> Any:
         try:
-            print(f"DEBUG: LangChain Callback Triggered for {serialized.get('name')}")
+            logger.debug("LangChain callback triggered for %s", serialized.get("name"))
             # Flatten messages list
             flat_messages = [m for sublist in messages for m in sublist]
             msg_dicts = [{"role": m.type, "content": m.content} for m in flat_messages]
             
-            self.current_request_id = self.llm_logger.log_request(
+            request_id = self.llm_logger.log_request(
                 model=serialized.get("name", "unknown"),
                 messages=msg_dicts,
                 agent_name=self.agent_name,
                 tools=kwargs.get("tools"),
             )
+            with self._lock:
+                self._request_ids[run_id] = request_id
         except Exception as e:
             logger.error(f"Error logging start: {e}")
 
@@ -55,7 +61,9 @@ class LangChainLoggingHandler(BaseCallbackHandler):
         **kwargs: Any,
     ) -> Any:
         try:
-            if not self.current_request_id:
+            with self._lock:
+                request_id = self._request_ids.pop(run_id, None)
+            if not request_id:
                 return
 
             generation = response.generations[0][0]
@@ -67,7 +75,7 @@ class LangChainLoggingHandler(BaseCallbackHandler):
                 usage = response.llm_output.get("token_usage") or response.llm_output.get("usage")
 
             self.llm_logger.log_response(
-                request_id=self.current_request_id,
+                request_id=request_id,
                 response_text=output_text,
                 usage=usage,
                 tool_calls=None # LangChain handles tool parsing differently, mostly in text
@@ -84,9 +92,11 @@ class LangChainLoggingHandler(BaseCallbackHandler):
         **kwargs: Any,
     ) -> Any:
         try:
-            if self.current_request_id:
+            with self._lock:
+                request_id = self._request_ids.pop(run_id, None)
+            if request_id:
                 self.llm_logger.log_response(
-                    request_id=self.current_request_id,
+                    request_id=request_id,
                     response_text="",
                     error=str(error)
                 )
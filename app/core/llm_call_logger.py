@@ -2,12 +2,18 @@
 LLM Request/Response logger for debugging agent behavior.
 Captures every prompt sent and response received from LLMs.
 """
+import atexit
 import logging
 import json
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Any, Dict, Optional
-import hashlib
+import uuid
+
+from app.core.config import settings
+from app.core.logging_utils import get_session_log_file
 
 logger = logging.getLogger(__name__)
 
@@ -16,9 +22,6 @@ class LLMCallLogger:
     """Logs all LLM requests and responses in structured format."""
     
     def __init__(self, log_dir: Path = None):
-        from app.core.logging_utils import get_session_log_file
-        from app.core.config import settings
-        
         self.log_dir = log_dir or Path("logs/llm_calls")
         
         # Use centralized helper for rotation and cleanup
@@ -31,6 +34,12 @@ class LLMCallLogger:
             extension=".jsonl"
         )
         
+        # Entries are serialised and appended by a background writer thread
+        # (started on first use) so LLM callbacks never block on disk I/O
+        self._queue: "queue.SimpleQueue[Optional[Dict]]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        
         logger.info(f"📝 LLM calls will be logged to: {self.log_file}")
     
     def log_request(
@@ -54,7 +63,7 @@ class LLMCallLogger:
         timestamp = datetime.now().isoformat()
         
         # Generate request ID for matching with response
-        request_id = self._generate_request_id(timestamp, messages)
+        request_id = self._generate_request_id()
         
         # Extract the actual prompt (usually the last user message)
         prompt_text = self._extract_prompt(messages)
@@ -128,15 +137,78 @@ class LLMCallLogger:
         
         return str(messages[-1]) if messages else ""
     
-    def _generate_request_id(self, timestamp: str, messages: list) -> str:
-        """Generate a unique ID for this request."""
-        content = f"{timestamp}_{str(messages)}"
-        return hashlib.md5(content.encode()).hexdigest()[:12]
+    def _generate_request_id(self) -> str:
+        """
+        Generate a unique ID for this request.
+
+        A random ID avoids stringifying and hashing the whole message list,
+        which grows with every tool turn.
+        """
+        return uuid.uuid4().hex[:12]
     
     def _write_log(self, entry: Dict):
-        """Write a log entry to the JSONL file."""
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(entry) + '\n')
+        """Queue a log entry for the background writer."""
+        if self._writer is None:
+            with self._lock:
+                if self._writer is None:
+                    self._writer = threading.Thread(
+                        target=self._writer_loop, name="llm-call-logger", daemon=True
+                    )
+                    self._writer.start()
+                    atexit.register(self.close)
+        self._queue.put(entry)
+    
+    def _writer_loop(self):
+        """Drain the queue into the JSONL file until a None sentinel arrives."""
+        f = None
+        try:
+            while True:
+                entry = self._queue.get()
+                # Batch whatever else is already queued into the same write
+                batch = []
+                while entry is not None:
+                    batch.append(entry)
+                    try:
+                        entry = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    # Never let a bad entry or an I/O error kill the writer:
+                    # the queue would then grow forever and close() would hang
+                    try:
+                        lines = []
+                        for item in batch:
+                            try:
+                                lines.append(json.dumps(item))
+                            except (TypeError, ValueError):
+                                logger.exception(f"Dropping unserialisable LLM call log entry {item.get('request_id')}")
+                        if lines:
+                            if f is None:
+                                f = open(self.log_file, 'a', encoding='utf-8')
+                            f.write('\n'.join(lines) + '\n')
+                            f.flush()
+                    except Exception:
+                        logger.exception(f"Failed to write {len(batch)} LLM call log entries to {self.log_file}")
+                        # Reopen on the next batch in case the handle went bad
+                        if f is not None:
+                            try:
+                                f.close()
+                            except Exception:
+                                pass
+                            f = None
+                if entry is None:
+                    return
+        finally:
+            if f is not None:
+                f.close()
+    
+    def close(self):
+        """Flush pending entries and stop the background writer."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(None)
+            writer.join()
 
 
 # Global logger instance
@@ -1,6 +1,8 @@
 import logging
 import sys
 import re
+import os
+from datetime import datetime
 
 class StreamToLogger(object):
     """
@@ -45,10 +47,6 @@ def get_session_log_file(base_name: str, logs_dir: "pathlib.Path", max_files: in
     Returns:
         Path to the new log file
     """
-    from datetime import datetime
-    import glob
-    import os
-    
     # ensure logs_dir exists
     if not logs_dir.exists():
         logs_dir.mkdir(parents=True, exist_ok=True)
@@ -59,17 +57,22 @@ def get_session_log_file(base_name: str, logs_dir: "pathlib.Path", max_files: in
     
     # Cleanup old logs
     try:
-        # Find all files matching the pattern
-        pattern = str(logs_dir / f"{base_name}_*{extension}")
-        files = glob.glob(pattern)
+        # Find all files matching the pattern, stat'ing each one once
+        prefix = f"{base_name}_"
+        with os.scandir(logs_dir) as entries:
+            files = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in entries
+                if entry.is_file() and entry.name.startswith(prefix) and entry.name.endswith(extension)
+            ]
         
         # Sort by modification time (newest last)
-        files.sort(key=os.path.getmtime)
+        files.sort()
         
-        # Remove old files if we have more than max_files
-        while len(files) >= max_files:
-            os.remove(files[0])
-            files.pop(0)
+        # Remove the oldest files so that, with the new one, we keep max_files
+        excess = len(files) - max_files + 1
+        for _, path in files[:max(excess, 0)]:
+            os.remove(path)
             
     except Exception as e:
         print(f"Warning: Failed to cleanup old logs: {e}")
@@ -0,0 +1,106 @@
+"""
+Shared Ollama chat clients for the LangGraph agents.
+Each client is built once per configuration and reused across node factories.
+
+Prompt prefix invariant: agent system prompts are static module-level strings
+and all per-request data (topic, filename, feedback) goes into the human
+message. Ollama reuses the KV cache of a matching prompt prefix while the
+model stays loaded, so keep dynamic values out of system prompts.
+"""
+import os
+import logging
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+from langchain_ollama import ChatOllama
+
+from app.core.langchain_logging_callback import LangChainLoggingHandler
+
+logger = logging.getLogger(__name__)
+
+# The stock qwen2.5 tags on Ollama are already Q4_K_M; point OLLAMA_MODEL at a
+# q8_0 tag to trade speed for quality.
+DEFAULT_MODEL = os.getenv("OLLAMA_MODEL", "qwen2.5:7b-instruct")
+DEFAULT_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", "10240"))
+
+# Review profile for the auditor and critique agents: optionally a smaller model,
+# e.g. qwen2.5:3b-instruct, to keep prefill fast. Only the auditor uses the
+# smaller context; it reads the article once and emits a short report, while
+# critique also carries retrieval and search results on its FAIL path.
+REVIEW_MODEL = os.getenv("OLLAMA_REVIEW_MODEL", DEFAULT_MODEL)
+AUDIT_NUM_CTX = int(os.getenv("OLLAMA_AUDIT_NUM_CTX", "8192"))
+# Output cap for the auditor. It only reads the article and writes a critique,
+# so a runaway generation is cut off instead of decoding up to the context
+# limit. Agents that pass whole articles as tool arguments are left uncapped.
+AUDIT_NUM_PREDICT = int(os.getenv("OLLAMA_AUDIT_NUM_PREDICT", "1024"))
+# How long Ollama keeps the model (and its prompt cache) loaded between calls
+DEFAULT_KEEP_ALIVE = "30m"
+
+# Connection pool limits for the sync transport shared by every agent's client
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=60)
+
+
+@lru_cache(maxsize=1)
+def _get_sync_transport() -> httpx.HTTPTransport:
+    """Sync HTTP transport (and connection pool) shared by all Ollama clients."""
+    return httpx.HTTPTransport(limits=HTTP_LIMITS)
+
+
+@lru_cache(maxsize=32)
+def get_chat_ollama(
+    temperature: float,
+    model: str = DEFAULT_MODEL,
+    num_ctx: int = DEFAULT_NUM_CTX,
+    num_predict: Optional[int] = None,
+) -> ChatOllama:
+    """
+    Get the shared ChatOllama client for a model configuration.
+
+    Clients are cached per (temperature, model, num_ctx, num_predict), so agents with the
+    same settings share one client, and rebuilding a node reuses it instead of
+    constructing a new one. Sync calls from every client go through one shared
+    HTTP transport, so keep-alive connections are reused across agents. The
+    async side is not shared: pooled async connections are bound to the event
+    loop that opened them, and the API runs graphs on different loops. Per-agent
+    logging is attached to the agent with get_agent_config(), not the client.
+
+    Args:
+        temperature: Sampling temperature
+        model: Ollama model tag
+        num_ctx: Context window size in tokens
+        num_predict: Maximum tokens to generate per call (None = no cap)
+
+    Returns:
+        Shared ChatOllama instance
+    """
+    logger.info(
+        f"Creating ChatOllama client ({model}, temperature={temperature}, "
+        f"num_ctx={num_ctx}, num_predict={num_predict})"
+    )
+    return ChatOllama(
+        model=model,
+        base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+        temperature=temperature,
+        num_ctx=num_ctx,
+        num_predict=num_predict,
+        keep_alive=os.getenv("OLLAMA_KEEP_ALIVE", DEFAULT_KEEP_ALIVE),
+        sync_client_kwargs={"transport": _get_sync_transport()},
+    )
+
+
+@lru_cache(maxsize=None)
+def get_agent_config(agent_name: str) -> dict:
+    """
+    Get the run config that logs an agent's LLM calls under its name.
+
+    Apply it to the compiled agent with `.with_config(...)`; callbacks set on
+    the agent propagate to every LLM call it makes.
+
+    Args:
+        agent_name: Name reported to the LLM call logger
+
+    Returns:
+        RunnableConfig dict with the agent's logging handler
+    """
+    return {"callbacks": [LangChainLoggingHandler(agent_name=agent_name)]}
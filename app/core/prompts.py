@@ -0,0 +1,21 @@
+"""
+Prompt loader shared by the LangGraph and CrewAI runners.
+Task prompts live as YAML files in the top-level prompts directory.
+"""
+from pathlib import Path
+
+import yaml
+
+PROMPTS_DIR = Path(__file__).resolve().parents[2] / "prompts"
+
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_prompt(filename: str) -> dict:
+    """Load a YAML prompt file from the prompts directory."""
+    file_path = PROMPTS_DIR / filename
+    if not file_path.exists():
+        raise FileNotFoundError(f"Prompt file not found: {file_path}")
+    with open(file_path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
@@ -0,0 +1,24 @@
+"""
+Topic slug helper shared by the API job service and the LangGraph runner.
+Both derive an article's expected filename from its topic, so they must agree.
+"""
+import re
+
+# Runs of characters that are not allowed in a topic slug
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9]+')
+
+
+def topic_slug(topic: str) -> str:
+    """
+    Convert a topic to a filename slug.
+
+    Lowercases the topic and collapses every run of non-alphanumeric characters
+    into a single hyphen, e.g. "Coffee: A Guide" -> "coffee-a-guide".
+
+    Args:
+        topic: Article topic
+
+    Returns:
+        Slug without leading or trailing hyphens
+    """
+    return _SLUG_INVALID_RE.sub('-', topic.lower()).strip('-')
@@ -4,6 +4,7 @@ Proper file structure with separation of concerns
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import logging
 
 from app.core.config import settings
@@ -92,8 +93,8 @@ async def startup_event():
         response = requests.get(f"{settings.ollama_base_url}/api/tags", timeout=5)
         if response.status_code == 200:
             models = response.json()
-            model_names = [m['name'] for m in models.get('models', [])]
-            logger.info(f"✓ Ollama connected successfully. Available models: {model_names}")
+            model_names = {m['name'] for m in models.get('models', [])}
+            logger.info(f"✓ Ollama connected successfully. Available models: {sorted(model_names)}")
 
             # Verify required models
             required_models = ['llama3.1:8b', 'mistral:7b']
@@ -121,10 +122,15 @@ def read_root():
     }
 
 
+def _count_articles() -> int:
+    """Count markdown articles in one directory pass."""
+    return sum(1 for _ in articles.iter_article_entries(settings.articles_dir))
+
+
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
 async def health_check():
     """Health check endpoint"""
-    articles_count = len(list(settings.articles_dir.glob("*.md"))) if settings.articles_dir.exists() else 0
+    articles_count = await asyncio.to_thread(_count_articles) if settings.articles_dir.exists() else 0
     
     return HealthResponse(
         status="healthy",
@@ -8,6 +8,20 @@ from datetime import datetime
 from enum import Enum
 import re
 
+# Injection markers rejected in topics, combined into one pattern so a topic is
+# scanned once instead of once per marker
+_SUSPICIOUS_TOPIC_RE = re.compile(
+    r'<script'         # Script injection
+    r'|javascript:'    # JavaScript protocol
+    r'|eval\('         # Eval injection
+    r'|system\('       # System command injection
+    r'|__import__'     # Python import injection
+    r'|exec\(',        # Exec injection
+    re.IGNORECASE
+)
+_ALNUM_RE = re.compile(r'[a-zA-Z0-9]')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
 
 class JobStatusEnum(str, Enum):
     """Job status enumeration"""
@@ -35,29 +49,18 @@ class GenerateRequest(BaseModel):
         v = v.strip()
 
         # Check for suspicious patterns
-        suspicious_patterns = [
-            r'<script',  # Script injection
-            r'javascript:',  # JavaScript protocol
-            r'eval\(',  # Eval injection
-            r'system\(',  # System command injection
-            r'__import__',  # Python import injection
-            r'exec\(',  # Exec injection
-        ]
-
-        v_lower = v.lower()
-        for pattern in suspicious_patterns:
-            if re.search(pattern, v_lower):
-                raise ValueError(
-                    f"Topic contains suspicious content. "
-                    f"Please use only alphanumeric characters, spaces, and basic punctuation."
-                )
+        if _SUSPICIOUS_TOPIC_RE.search(v):
+            raise ValueError(
+                f"Topic contains suspicious content. "
+                f"Please use only alphanumeric characters, spaces, and basic punctuation."
+            )
 
         # Ensure it's not just whitespace or special characters
-        if not re.search(r'[a-zA-Z0-9]', v):
+        if not _ALNUM_RE.search(v):
             raise ValueError("Topic must contain at least one alphanumeric character")
 
         # Collapse multiple spaces into single space
-        v = re.sub(r'\s+', ' ', v)
+        v = _WHITESPACE_RUN_RE.sub(' ', v)
 
         return v
 
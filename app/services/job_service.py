@@ -5,6 +5,7 @@ Handles background job execution and tracking
 from typing import Dict, Optional
 from datetime import datetime
 import uuid
+import json
 import logging
 import sys
 from pathlib import Path
@@ -15,10 +16,24 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from app.schemas.models import JobResponse, JobStatusEnum
 from app.core.config import settings
+from app.core.slugs import topic_slug
 from run_crew import crew
 
 logger = logging.getLogger(__name__)
 
+# Filename patterns tried in order when the crew result is not JSON
+_FILENAME_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'Article written to:\s*([^\s\n]+\.md)',
+        r'Revision complete:\s*([^\s\n]+\.md)',
+        r'saved to:\s*([^\s\n]+\.md)',
+        r'wrote to:\s*([^\s\n]+\.md)',
+        r'filename["\']?:\s*["\']?([^\s\n"\']+\.md)',
+        r'"filename":\s*"([^"]+\.md)"',  # JSON field in text
+    )
+]
+
 
 class JobService:
     """Service for managing content generation jobs"""
@@ -33,8 +48,6 @@ class JobService:
         1. JSON parsing (if agent outputs structured JSON)
         2. Regex patterns (for natural language outputs)
         """
-        import json
-
         # Method 1: Try JSON parsing first (most reliable)
         try:
             # Look for JSON-like structure in the result
@@ -47,16 +60,8 @@ class JobService:
             pass
 
         # Method 2: Regex patterns (fallback for natural language)
-        patterns = [
-            r'Article written to:\s*([^\s\n]+\.md)',
-            r'Revision complete:\s*([^\s\n]+\.md)',
-            r'saved to:\s*([^\s\n]+\.md)',
-            r'wrote to:\s*([^\s\n]+\.md)',
-            r'filename["\']?:\s*["\']?([^\s\n"\']+\.md)',
-            r'"filename":\s*"([^"]+\.md)"',  # JSON field in text
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, result_str, re.IGNORECASE)
+        for pattern in _FILENAME_PATTERNS:
+            match = pattern.search(result_str)
             if match:
                 return match.group(1)
 
@@ -65,8 +70,7 @@ class JobService:
     def _construct_filename_from_topic(self, topic: str) -> str:
         """Construct expected filename from topic"""
         # Convert topic to slug: lowercase, replace spaces/special chars with hyphens
-        slug = re.sub(r'[^a-z0-9]+', '-', topic.lower()).strip('-')
-        return f"{slug}.md"
+        return f"{topic_slug(topic)}.md"
 
     def _validate_job_completion(self, job_id: str, result_str: str, topic: str = None) -> tuple[bool, Optional[str]]:
         """
@@ -129,6 +133,9 @@ class JobService:
         """Create a new content generation job"""
         job_id = str(uuid.uuid4())
         
+        # Job records are only built here, from a validated GenerateRequest topic
+        # and internal values, so responses use model_construct() and skip
+        # re-validation
         job_data = {
             "job_id": job_id,
             "status": JobStatusEnum.PENDING,
@@ -142,18 +149,18 @@ class JobService:
         self.jobs[job_id] = job_data
         logger.info(f"Created job {job_id} for topic: {topic}")
         
-        return JobResponse(**job_data)
+        return JobResponse.model_construct(**job_data)
     
     def get_job(self, job_id: str) -> JobResponse:
         """Get job status by ID"""
         if job_id not in self.jobs:
             raise ValueError(f"Job {job_id} not found")
         
-        return JobResponse(**self.jobs[job_id])
+        return JobResponse.model_construct(**self.jobs[job_id])
     
     def list_jobs(self) -> list:
         """List all jobs"""
-        return [JobResponse(**job) for job in self.jobs.values()]
+        return [JobResponse.model_construct(**job) for job in self.jobs.values()]
     
     def run_job(self, job_id: str):
         """Execute a content generation job with validation"""
@@ -1,11 +1,11 @@
 import os
 import logging
 from pathlib import Path
-import yaml
 from crewai import Crew, Process, Task
 from dotenv import load_dotenv
 
 from app.core.config import settings
+from app.core.prompts import load_prompt
 
 # Load environment variables from .env file
 load_dotenv()
@@ -61,7 +61,7 @@ logger = logging.getLogger(__name__)
 # Import tools
 from tools.scraper_tool import ScraperTool
 from tools.file_writer_tool import FileWriterTool
-from tools.rag_tool import RAGTool
+from tools.rag_tool import get_rag_tool
 from tools.file_reader_tool import FileReaderTool
 
 # Import agent factories
@@ -70,7 +70,7 @@ from agents import create_researcher, create_generator, create_auditor
 # Initialize tools
 scraper_tool = ScraperTool()
 file_writer_tool = FileWriterTool()
-rag_tool = RAGTool()
+rag_tool = get_rag_tool()
 file_reader_tool = FileReaderTool()
 
 # Setup LLM request/response logging
@@ -81,18 +81,6 @@ logger.info("🔍 LLM call logging enabled - check logs/llm_calls/")
 # Ollama configuration
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/v1")
 
-# --- Helper: Load Prompt ---
-def load_prompt(filename: str) -> dict:
-    """Load a YAML prompt file from the prompts directory."""
-    prompts_dir = Path(__file__).parent / "prompts"
-    file_path = prompts_dir / filename
-    
-    if not file_path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {file_path}")
-        
-    with open(file_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
-
 # --- Agent Initialization ---
 # Each agent uses its own optimized model
 researcher = create_researcher(tools=[scraper_tool], base_url=OLLAMA_BASE_URL)
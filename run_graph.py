@@ -1,42 +1,30 @@
 
-import os
+import re
 import logging
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
 from typing import TypedDict, List, Annotated
 from typing_extensions import NotRequired
 
-from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_ollama import ChatOllama
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langgraph.graph import StateGraph, END, START
 from langgraph.graph.message import add_messages
 
 from app.core.config import settings
-from app.core.langchain_logging_callback import LangChainLoggingHandler
+from app.core.ollama_clients import REVIEW_MODEL
+from app.core.prompts import load_prompt
+from app.core.slugs import topic_slug
 
 # --- Tools Imports ---
-# We need to adapt tools to be bindable functions or Pydantic tools
-from langchain_core.tools import tool
-from tools.scraper_tool import ScraperTool
-from tools.file_writer_tool import FileWriterTool
-from tools.rag_tool import RAGTool
+from tools.rag_tool import get_rag_tool
 from tools.file_reader_tool import FileReaderTool
+from tools.word_count_tool import count_markdown_words
 
 # Setup Logger
 logger = logging.getLogger(__name__)
 
 # --- 1. Define State ---
-import yaml
-from pathlib import Path
-
-def load_prompt(filename: str) -> dict:
-    """Load a YAML prompt file from the prompts directory."""
-    prompts_dir = Path(__file__).parent / "prompts"
-    file_path = prompts_dir / filename
-    if not file_path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {file_path}")
-    with open(file_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
-
 # Load prompts
 audit_config = load_prompt("audit_task.yaml")
 generation_config = load_prompt("generation_task.yaml")
@@ -44,6 +32,24 @@ research_config = load_prompt("research_task.yaml")
 revision_config = load_prompt("revision_task.yaml")
 critique_config = load_prompt("critique_task.yaml")
 
+_TASK_CONFIGS = {
+    "audit": audit_config,
+    "generation": generation_config,
+    "research": research_config,
+    "revision": revision_config,
+    "critique": critique_config,
+}
+
+@lru_cache(maxsize=128)
+def render_task_description(task: str, **fields) -> str:
+    """
+    Render a task's description template with the given fields.
+
+    The critique/audit/revision loops re-render the same template for the same
+    topic on every pass, so rendered descriptions are cached.
+    """
+    return _TASK_CONFIGS[task]['description'].format(**fields)
+
 class AgentState(TypedDict):
     topic: str
     research_data: List[str]  # Just URLs for now, or summaries
@@ -56,50 +62,14 @@ class AgentState(TypedDict):
     messages: Annotated[List[BaseMessage], add_messages]
 
 # --- 2. Setup Tools ---
-# We wrap CrewAI tools into LangChain compatible tools if needed.
-# Since we want NATIVE tool calling, we should ideally define them as functions with Pydantic args.
-
-# Initialize existing tools
-scraper = ScraperTool()
-file_writer = FileWriterTool()
-rag = RAGTool()
+# Agents own their tool wrappers (see agents/). The graph itself only needs the
+# shared RAG store (for --clear-rag) and a reader for the audit cache.
+rag = get_rag_tool()
 file_reader = FileReaderTool()
 
-# We need to expose the underlying run method as a tool for LangChain to bind to
-# For simplicity in this v1 migration, we will create simple wrapper functions annotated with @tool
-# equal to the logic we want.
-
-@tool
-def scrape_website(url: str):
-    """Scrape content from a website URL."""
-    return scraper._run(url)
-
-@tool
-def save_article(filename: str, content: str):
-    """Save the full markdown article to a file."""
-    if not content or len(content) < 50:
-        return "Error: Content too short to save."
-    return file_writer._run(filename=filename, content=content)
-
-@tool
-def ingest_content(url: str):
-    """Ingest a URL into the RAG knowledge base."""
-    return rag._run(action="ingest", url=url)
-
-@tool
-def retrieve_context(query: str):
-    """Retrieve relevant context from the knowledge base."""
-    return rag._run(action="retrieve", query=query)
-
-# Group tools by agent
-research_tools = [scrape_website]
-generator_tools = [save_article, ingest_content, retrieve_context]
-# Auditor just gives feedback, no tools needed usually, maybe reader?
-auditor_tools = [] 
-
 # --- 3. Setup Nodes from Modules ---
 from agents.researcher import create_researcher_node
-from agents.generator import create_generator_node
+from agents.generator import create_generator_node, reset_seen_queries
 from agents.auditor import create_auditor_node
 from agents.reviser import create_seo_reviser_node
 from agents.critique import create_critique_node
@@ -111,6 +81,37 @@ auditor_agent = create_auditor_node()
 reviser_agent = create_seo_reviser_node()
 critique_agent = create_critique_node()
 
+# Verdict markers parsed from the critique and auditor replies
+_CRITIQUE_STATUS_RE = re.compile(r'\*\*Status:\*\*\s*(PASS|FAIL)', re.IGNORECASE)
+_QUALITY_SCORE_RE = re.compile(r'(?:Quality Score|Score):\s*(\d+)/10', re.IGNORECASE)
+
+# --- Audit Cache ---
+# Audit results keyed by a digest of (topic, article paragraphs, model). When a
+# revision leaves the article unchanged (or only reflows whitespace), the
+# previous audit is reused instead of running the auditor LLM again.
+AUDIT_CACHE_SIZE = 32
+_audit_cache: "OrderedDict[str, str]" = OrderedDict()
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+
+def _paragraph_hashes(text: str) -> List[bytes]:
+    """Digest of each non-empty paragraph, ignoring whitespace-only differences."""
+    hashes = []
+    for paragraph in _PARAGRAPH_SPLIT_RE.split(text):
+        lines = [" ".join(line.split()) for line in paragraph.strip().splitlines()]
+        if lines:
+            hashes.append(hashlib.blake2b("\n".join(lines).encode("utf-8"), digest_size=16).digest())
+    return hashes
+
+def _audit_cache_key(topic: str, article: str) -> str:
+    """Content-addressed key for an audit of `article` on `topic`."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (topic, REVIEW_MODEL):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\n")
+    for paragraph_hash in _paragraph_hashes(article):
+        digest.update(paragraph_hash)
+    return digest.hexdigest()
+
 # --- 4. Define Node Logic (Wrapping agents to handle State) ---
 
 def researcher_node_wrapper(state: AgentState):
@@ -118,7 +119,7 @@ def researcher_node_wrapper(state: AgentState):
     messages = state['messages']
     if not messages:
         # Use research task description
-        prompt = research_config['description'].format(topic=state['topic'])
+        prompt = render_task_description("research", topic=state['topic'])
         messages = [HumanMessage(content=prompt)]
 
     # Limit agent's internal tool-calling loop (search + scrape 4 URLs + ingest 4 = ~20 calls max)
@@ -127,15 +128,16 @@ def researcher_node_wrapper(state: AgentState):
 
 def generator_node_wrapper(state: AgentState):
     logger.info("--- Generator Agent ---")
+    reset_seen_queries()
     # Get the last message from the researcher
     last_message = state['messages'][-1].content
 
     # Use generation task description
-    instruction = generation_config['description'].format(topic=state['topic'])
+    instruction = render_task_description("generation", topic=state['topic'])
     # Append context from researcher
     instruction += f"\n\nCONTEXT FROM RESEARCHER:\n{last_message}"
 
-    print(f"\n\n=== DEBUG: GENERATOR PROMPT ({len(instruction)} chars) ===\n{instruction}\n==========================================\n")
+    logger.debug("=== GENERATOR PROMPT (%d chars) ===\n%s", len(instruction), instruction)
 
     # Limit agent's internal tool-calling loop (retrieve ~5x + save = ~15 calls max)
     result = generator_agent.invoke({"messages": [HumanMessage(content=instruction)]}, config={"recursion_limit": 20})
@@ -156,16 +158,38 @@ def auditor_node_wrapper(state: AgentState):
     logger.info("--- Auditor Agent ---")
 
     # Use audit task description
-    instruction = audit_config['description'].format(topic=state['topic'])
+    parts = [render_task_description("audit", topic=state['topic'])]
 
     # Add filename information if available
     if state.get('filename'):
-        instruction += f"\n\n**ARTICLE FILENAME TO AUDIT:** `{state['filename']}`\n"
-        instruction += f"Use the `read_article_file` tool with filename=\"{state['filename']}\" to read the article."
+        parts.append(f"\n\n**ARTICLE FILENAME TO AUDIT:** `{state['filename']}`\n")
+        parts.append(f"Use the `read_article_file` tool with filename=\"{state['filename']}\" to read the article.")
         logger.info(f"Auditor will read file: {state['filename']}")
+    instruction = "".join(parts)
+
+    # Reuse the previous audit if the article has not changed since
+    cache_key = None
+    if state.get('filename'):
+        article = file_reader._run(filename=state['filename'])
+        if not article.startswith("❌"):
+            cache_key = _audit_cache_key(state['topic'], article)
+            cached_audit = _audit_cache.get(cache_key)
+            if cached_audit is not None:
+                _audit_cache.move_to_end(cache_key)
+                logger.info(f"Article unchanged since last audit, reusing cached audit for: {state['filename']}")
+                return {"messages": [AIMessage(content=cached_audit)]}
 
     # Limit agent's internal tool-calling loop (read + analyze = ~5 calls max)
     result = auditor_agent.invoke({"messages": [HumanMessage(content=instruction)]}, config={"recursion_limit": 10})
+
+    # Only cache complete audits; an empty or score-less reply must not be
+    # replayed for every later identical draft
+    audit = result["messages"][-1].content
+    if cache_key and _QUALITY_SCORE_RE.search(audit):
+        _audit_cache[cache_key] = audit
+        if len(_audit_cache) > AUDIT_CACHE_SIZE:
+            _audit_cache.popitem(last=False)
+
     return {"messages": result["messages"]}
 
 def reviser_node_wrapper(state: AgentState):
@@ -179,17 +203,18 @@ def reviser_node_wrapper(state: AgentState):
     audit_feedback = state['messages'][-1].content
 
     # Use revision task description
-    instruction = revision_config['description'].format(topic=state['topic'])
+    parts = [render_task_description("revision", topic=state['topic'])]
 
     # Add filename and audit feedback context
     if state.get('filename'):
-        instruction += f"\n\n**ARTICLE FILENAME:** `{state['filename']}`\n"
-        instruction += f"Use the `read_file` tool with filename=\"{state['filename']}\" to read the current article.\n"
+        parts.append(f"\n\n**ARTICLE FILENAME:** `{state['filename']}`\n")
+        parts.append(f"Use the `read_file` tool with filename=\"{state['filename']}\" to read the current article.\n")
         logger.info(f"Reviser will revise file: {state['filename']}")
 
-    instruction += f"\n\n**AUDIT FEEDBACK FROM PREVIOUS STEP:**\n{audit_feedback}\n"
-    instruction += f"\n**REVISION ATTEMPT:** {revision_count}/3\n"
-    instruction += "\nImplement ALL required changes to achieve a 10/10 score."
+    parts.append(f"\n\n**AUDIT FEEDBACK FROM PREVIOUS STEP:**\n{audit_feedback}\n")
+    parts.append(f"\n**REVISION ATTEMPT:** {revision_count}/3\n")
+    parts.append("\nImplement ALL required changes to achieve a 10/10 score.")
+    instruction = "".join(parts)
 
     # Use the dedicated reviser agent
     # Limit agent's internal tool-calling loop (read + revise + save = ~8 calls max)
@@ -219,16 +244,18 @@ def critique_node_wrapper(state: AgentState):
     logger.info(f"Critique evaluation {critique_count}/3 (target: {target_length} words)")
     
     # Use critique task description
-    instruction = critique_config['description'].format(
+    parts = [render_task_description(
+        "critique",
         topic=state['topic'],
         target_length=target_length
-    )
+    )]
     
     # Add filename information
     if state.get('filename'):
-        instruction += f"\n\n**ARTICLE FILENAME:** `{state['filename']}`\n"
-        instruction += f"Use the `read_file` tool with filename=\"{state['filename']}\" to read the article."
+        parts.append(f"\n\n**ARTICLE FILENAME:** `{state['filename']}`\n")
+        parts.append(f"Use the `read_file` tool with filename=\"{state['filename']}\" to read the article.")
         logger.info(f"Critique will evaluate file: {state['filename']}")
+    instruction = "".join(parts)
     
     # Limit agent's internal tool-calling loop (read + evaluate = ~5 calls max)
     result = critique_agent.invoke({"messages": [HumanMessage(content=instruction)]}, config={"recursion_limit": 10})
@@ -258,8 +285,7 @@ def should_continue_critique(state: AgentState) -> str:
         for msg in reversed(messages):
             content = msg.content if hasattr(msg, 'content') else str(msg)
             # Check for PASS/FAIL status
-            import re
-            status_match = re.search(r'\*\*Status:\*\*\s*(PASS|FAIL)', content, re.IGNORECASE)
+            status_match = _CRITIQUE_STATUS_RE.search(content)
             if status_match:
                 status = status_match.group(1).upper()
                 logger.info(f"Detected critique status: {status}")
@@ -298,8 +324,7 @@ def should_continue_revising(state: AgentState) -> str:
         for msg in reversed(messages):
             content = msg.content if hasattr(msg, 'content') else str(msg)
             # Simple pattern matching for score
-            import re
-            score_match = re.search(r'(?:Quality Score|Score):\s*(\d+)/10', content, re.IGNORECASE)
+            score_match = _QUALITY_SCORE_RE.search(content)
             if score_match:
                 score = int(score_match.group(1))
                 logger.info(f"Detected quality score: {score}/10")
@@ -366,13 +391,9 @@ def validate_revision_quality(topic: str, filename: str = None) -> bool:
     Returns:
         bool: True if validation passes, False otherwise
     """
-    from pathlib import Path
-    from app.core.config import settings
-
     # Construct expected filename if not provided
     if not filename:
-        slug = topic.lower().replace(' ', '-').replace('_', '-')
-        filename = f"{slug}.md"
+        filename = f"{topic_slug(topic)}.md"
 
     article_path = settings.articles_dir / filename
 
@@ -380,9 +401,6 @@ def validate_revision_quality(topic: str, filename: str = None) -> bool:
         logger.error(f"❌ Validation FAILED: Article not found at {article_path}")
         return False
 
-
-    from tools.word_count_tool import count_markdown_words
-
     # Read content
     content = article_path.read_text(encoding='utf-8')
     word_count = count_markdown_words(content)
@@ -507,7 +525,6 @@ if __name__ == "__main__":
         config={"recursion_limit": 300}  # High limit for 5 agents + dual revision loops
     )
 
-    print("\n\n----------------- FINAL OUTPUT -----------------\n")
     print("\n\n----------------- FINAL OUTPUT -----------------\n")
 
     # Show revision statistics
@@ -0,0 +1,65 @@
+"""
+Unit tests for the LLM call logger's background writer
+"""
+import json
+import time
+
+import pytest
+
+from app.core.llm_call_logger import LLMCallLogger
+
+
+@pytest.fixture
+def call_logger(temp_dir):
+    """LLMCallLogger writing into a temporary directory"""
+    instance = LLMCallLogger(log_dir=temp_dir)
+    yield instance
+    instance.close()
+
+
+def read_entries(call_logger):
+    """Parse every JSONL entry written so far"""
+    return [json.loads(line) for line in call_logger.log_file.read_text(encoding='utf-8').splitlines()]
+
+
+class TestWriterThread:
+    """Test suite for the background writer"""
+
+    def test_close_drains_queued_entries(self, call_logger):
+        """Test close() writes every queued entry before returning"""
+        request_ids = [
+            call_logger.log_request(model="m", messages=[{"role": "user", "content": f"q{i}"}], agent_name="a")
+            for i in range(50)
+        ]
+        call_logger.close()
+
+        entries = read_entries(call_logger)
+        assert [e["request_id"] for e in entries] == request_ids
+        assert call_logger._writer is None
+
+    def test_unserialisable_entry_does_not_stop_writer(self, call_logger):
+        """Test a bad entry is dropped and later entries are still written"""
+        call_logger._write_log({"request_id": "bad", "payload": object()})
+        good_id = call_logger.log_request(model="m", messages=[], agent_name="a")
+        call_logger.close()
+
+        assert [e["request_id"] for e in read_entries(call_logger)] == [good_id]
+
+    def test_write_error_does_not_stop_writer(self, call_logger, monkeypatch):
+        """Test an I/O error on one batch is logged and the same writer keeps draining"""
+        log_file = call_logger.log_file
+        monkeypatch.setattr(call_logger, "log_file", log_file.parent / "missing" / "calls.jsonl")
+        call_logger.log_request(model="m", messages=[], agent_name="a")
+        writer = call_logger._writer
+
+        deadline = time.monotonic() + 5
+        while not call_logger._queue.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+
+        monkeypatch.setattr(call_logger, "log_file", log_file)
+        good_id = call_logger.log_request(model="m", messages=[], agent_name="a")
+        assert writer.is_alive()
+        call_logger.close()
+
+        assert [e["request_id"] for e in read_entries(call_logger)] == [good_id]
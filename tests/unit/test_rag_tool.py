@@ -0,0 +1,102 @@
+"""
+Unit tests for RAGTool retrieval caching
+"""
+import pytest
+from tools import rag_tool
+from tools.rag_tool import RAGTool, normalize_query
+
+
+class CountingCollection:
+    """Wraps the mock collection and counts queries"""
+
+    def __init__(self, collection):
+        self._collection = collection
+        self.query_calls = 0
+
+    def add(self, **kwargs):
+        self._collection.add(**kwargs)
+
+    def query(self, **kwargs):
+        self.query_calls += 1
+        return self._collection.query(**kwargs)
+
+    def count(self):
+        return self._collection.count()
+
+
+@pytest.fixture
+def rag(monkeypatch, mock_rag_collection, mock_scraped_chunks):
+    """RAGTool backed by the mock collection instead of ChromaDB"""
+    monkeypatch.setattr(RAGTool, "_initialize_chroma", lambda self: None)
+    rag_tool.clear_retrieve_cache()
+    tool = RAGTool()
+    tool._collection = CountingCollection(mock_rag_collection)
+    monkeypatch.setattr(tool, "_get_cached_chunks", lambda url: mock_scraped_chunks)
+    yield tool
+    rag_tool.clear_retrieve_cache()
+
+
+class TestRetrieveCache:
+    """Test suite for the shared retrieval cache"""
+
+    def test_normalize_query(self):
+        """Test case and whitespace are ignored"""
+        assert normalize_query("  French   Press\tGrind ") == "french press grind"
+
+    def test_repeated_query_hits_cache(self, rag):
+        """Test equivalent queries only hit the collection once"""
+        rag.ingest("https://example.com/test")
+        first = rag.retrieve("French press grind")
+        second = rag.retrieve("  french PRESS grind ")
+        assert first == second
+        assert rag._collection.query_calls == 1
+
+    def test_ingest_invalidates_cache(self, rag):
+        """Test new documents invalidate cached results"""
+        rag.ingest("https://example.com/test")
+        rag.retrieve("french press")
+        rag.ingest("https://example.com/other")
+        rag.retrieve("french press")
+        assert rag._collection.query_calls == 2
+
+
+class TestIngestBatch:
+    """Test suite for RAGTool.ingest_batch"""
+
+    def test_single_add_for_all_urls(self, rag, monkeypatch):
+        """Test chunks from every URL are added in one call"""
+        add_calls = []
+        monkeypatch.setattr(rag._collection, "add", lambda **kwargs: add_calls.append(kwargs))
+        monkeypatch.setattr(rag, "_get_cached_chunks", lambda url: [
+            {"content": f"content of {url}", "metadata": {"url": url, "chunk_index": 0}}
+        ])
+
+        result = rag.ingest_batch(["https://a.com", "https://b.com", "https://a.com"])
+
+        assert len(add_calls) == 1
+        assert add_calls[0]["documents"] == ["content of https://a.com", "content of https://b.com"]
+        assert result.count("✅") == 2
+
+    def test_skips_ingested_and_uncached(self, rag, monkeypatch):
+        """Test already-ingested and unscraped URLs are reported, not added"""
+        rag.ingest("https://example.com/test")
+        monkeypatch.setattr(rag, "_get_cached_chunks", lambda url: [])
+
+        result = rag.ingest_batch(["https://example.com/test", "https://new.com"])
+
+        assert "already ingested" in result
+        assert "No cached content" in result
+        assert rag._collection.count() == 2
+
+
+class TestSharedInstance:
+    """Test suite for the shared RAGTool accessor"""
+
+    def test_get_rag_tool_returns_one_instance(self, monkeypatch):
+        """Test every caller gets the same RAGTool"""
+        monkeypatch.setattr(RAGTool, "_initialize_chroma", lambda self: None)
+        rag_tool.get_rag_tool.cache_clear()
+        try:
+            assert rag_tool.get_rag_tool() is rag_tool.get_rag_tool()
+        finally:
+            rag_tool.get_rag_tool.cache_clear()
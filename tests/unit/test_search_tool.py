@@ -0,0 +1,44 @@
+"""
+Unit tests for web search result caching
+"""
+import pytest
+from tools import search_tool
+
+
+@pytest.fixture
+def ddgs_calls(monkeypatch):
+    """Replace the DDGS request with a stub that records queries"""
+    calls = []
+
+    def fake_search(query, max_results=7):
+        calls.append(query)
+        return [{"title": "Result", "href": "https://example.com", "body": "Snippet"}]
+
+    monkeypatch.setattr(search_tool, "_execute_ddgs_search", fake_search)
+    search_tool.clear_search_cache()
+    yield calls
+    search_tool.clear_search_cache()
+
+
+class TestSearchCache:
+    """Test suite for the DuckDuckGo result cache"""
+
+    def test_repeated_query_hits_cache(self, ddgs_calls):
+        """Test equivalent queries only reach DDGS once"""
+        first = search_tool._duckduckgo_search("Coffee Brewing Guide")
+        second = search_tool._duckduckgo_search("  coffee   brewing guide ")
+        assert first == second
+        assert ddgs_calls == ["Coffee Brewing Guide"]
+
+    def test_expired_entries_are_refetched(self, ddgs_calls, monkeypatch):
+        """Test entries older than the TTL are not reused"""
+        search_tool._duckduckgo_search("coffee")
+        monkeypatch.setattr(search_tool, "SEARCH_CACHE_TTL_SECONDS", -1)
+        search_tool._duckduckgo_search("coffee")
+        assert len(ddgs_calls) == 2
+
+    def test_failures_are_not_cached(self, ddgs_calls, monkeypatch):
+        """Test empty results are retried on the next call"""
+        monkeypatch.setattr(search_tool, "_execute_ddgs_search", lambda query, max_results=7: [])
+        assert search_tool._duckduckgo_search("coffee") == "No search results found."
+        assert search_tool._search_cache == {}
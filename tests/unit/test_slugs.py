@@ -0,0 +1,16 @@
+"""
+Unit tests for the shared topic slug helper
+"""
+from app.core.slugs import topic_slug
+
+
+class TestTopicSlug:
+    """Test suite for topic_slug"""
+
+    def test_punctuation_runs_collapse_to_one_hyphen(self):
+        """Test separators and punctuation become a single hyphen"""
+        assert topic_slug("Coffee: A Guide") == "coffee-a-guide"
+
+    def test_edges_are_stripped(self):
+        """Test leading and trailing separators are removed"""
+        assert topic_slug("  Home_Brewing / Tips?! ") == "home-brewing-tips"
@@ -122,15 +122,18 @@ class FileWriterTool(BaseTool):
             # BACKUP: If file exists, create backup before overwriting
             if file_path.exists():
                 try:
-                    existing_content = file_path.read_text(encoding='utf-8')
-                    existing_word_count = len(existing_content.split())
+                    # Raw bytes: the backup is a verbatim copy, so skip re-encoding it
+                    existing_bytes = file_path.read_bytes()
+                    # Count words the same way as the new content (str.split also
+                    # splits on Unicode whitespace such as NBSP)
+                    existing_word_count = len(existing_bytes.decode("utf-8", "replace").split())
                     
                     # Create timestamped backup
                     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                     backup_name = f"{file_path.stem}_v{timestamp}.md"
                     backup_path = versions_dir / backup_name
                     
-                    backup_path.write_text(existing_content, encoding='utf-8')
+                    backup_path.write_bytes(existing_bytes)
                     logger.info(f"📦 Backed up existing file ({existing_word_count} words) to: {backup_path.name}")
                     
                     # SAFETY CHECK: Warn if new content is much shorter than existing
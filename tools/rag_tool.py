@@ -11,10 +11,32 @@ from pathlib import Path
 import logging
 import hashlib
 import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# --- Retrieval Cache ---
+# Formatted retrieval results keyed by (store, normalized query, n_results).
+# Shared at module level so every RAGTool instance backed by the same
+# collection sees it; any ingest or clear invalidates it.
+RETRIEVE_CACHE_SIZE = 256
+_retrieve_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_retrieve_cache_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for cache lookups (case and whitespace insensitive)."""
+    return " ".join(query.lower().split())
+
+
+def clear_retrieve_cache():
+    """Drop all cached retrieval results."""
+    with _retrieve_cache_lock:
+        _retrieve_cache.clear()
+
 class RAGToolSchema(BaseModel):
     """Input for RAGTool."""
     action: str = Field(..., description="Action to perform: 'ingest' or 'retrieve'.")
@@ -68,10 +90,10 @@ class RAGTool(BaseTool):
                 metadata={"description": "ANCA scraped content storage"}
             )
             
-            logger.info(f"ChromaDB initialized: {self._collection.count()} documents")
+            logger.info("ChromaDB initialized: %s documents", self._collection.count())
 
         except Exception as e:
-            logger.error(f"Failed to initialize ChromaDB: {e}")
+            logger.error("Failed to initialize ChromaDB: %s", e)
             raise
 
     def clear_collection(self):
@@ -84,10 +106,11 @@ class RAGTool(BaseTool):
                 metadata={"description": "ANCA scraped content storage"}
             )
             self._ingested_urls.clear()
+            clear_retrieve_cache()
             logger.info("ChromaDB collection cleared")
             return "✅ Collection cleared successfully"
         except Exception as e:
-            logger.error(f"Failed to clear collection: {e}")
+            logger.error("Failed to clear collection: %s", e)
             return f"❌ Error clearing collection: {e}"
 
     def _generate_doc_id(self, url: str, chunk_index: int) -> str:
@@ -107,7 +130,7 @@ class RAGTool(BaseTool):
                     return data.get('chunks', [])
             return []
         except Exception as e:
-            logger.error(f"Error reading cache for {url}: {e}")
+            logger.error("Error reading cache for %s: %s", url, e)
             return []
     
     def ingest(self, url: str) -> str:
@@ -126,7 +149,7 @@ class RAGTool(BaseTool):
 
             # Skip if already ingested this session
             if url in self._ingested_urls:
-                logger.info(f"⏭️ Skipping already ingested URL: {url}")
+                logger.info("⏭️ Skipping already ingested URL: %s", url)
                 return f"⏭️ URL already ingested this session: {url}"
 
             chunks = self._get_cached_chunks(url)
@@ -135,22 +158,8 @@ class RAGTool(BaseTool):
                 return f"⚠️ No cached content found for {url}. Please scrape the URL first using ScraperTool."
             
             # Prepare data for ChromaDB
-            documents = []
-            metadatas = []
-            ids = []
-            
-            for chunk in chunks:
-                content = chunk.get('content', '')
-                metadata = chunk.get('metadata', {})
-                
-                # Generate unique ID
-                url_meta = metadata.get('url', url)
-                chunk_idx = metadata.get('chunk_index', 0)
-                doc_id = self._generate_doc_id(url_meta, chunk_idx)
-                
-                documents.append(content)
-                metadatas.append(metadata)
-                ids.append(doc_id)
+            documents, metadatas, ids = [], [], []
+            self._append_chunks(url, chunks, documents, metadatas, ids)
             
             # Add to collection
             if documents:
@@ -161,7 +170,8 @@ class RAGTool(BaseTool):
                 )
                 
                 self._ingested_urls.add(url)  # Mark as ingested
-                logger.info(f"Ingested {len(documents)} chunks from {url} into ChromaDB")
+                clear_retrieve_cache()  # New documents can change any result
+                logger.info("Ingested %s chunks from %s into ChromaDB", len(documents), url)
                 return f"✅ Successfully ingested {len(documents)} chunks from {url}"
             else:
                 return f"⚠️ Found 0 chunks for {url}."
@@ -171,6 +181,68 @@ class RAGTool(BaseTool):
             logger.error(error_msg)
             return error_msg
     
+    def ingest_batch(self, urls: List[str]) -> str:
+        """
+        Ingest several URLs from the ScraperTool cache with a single ChromaDB add.
+        
+        All chunks are embedded and written in one call instead of one round
+        trip per URL.
+        
+        Args:
+            urls: URLs of scraped pages
+            
+        Returns:
+            One status line per URL
+        """
+        try:
+            documents, metadatas, ids = [], [], []
+            status = {}
+            added = []
+            
+            for url in urls:
+                if not url or url in status:
+                    continue
+                if url in self._ingested_urls:
+                    status[url] = f"⏭️ URL already ingested this session: {url}"
+                    continue
+                chunks = self._get_cached_chunks(url)
+                if not chunks:
+                    status[url] = f"⚠️ No cached content found for {url}. Please scrape the URL first using ScraperTool."
+                    continue
+                self._append_chunks(url, chunks, documents, metadatas, ids)
+                status[url] = f"✅ Successfully ingested {len(chunks)} chunks from {url}"
+                added.append(url)
+            
+            if documents:
+                self._collection.add(
+                    documents=documents,
+                    metadatas=metadatas,
+                    ids=ids
+                )
+                self._ingested_urls.update(added)
+                clear_retrieve_cache()  # New documents can change any result
+                logger.info("Ingested %s chunks from %s URLs into ChromaDB", len(documents), len(added))
+            
+            return "\n".join(status.values())
+            
+        except Exception as e:
+            error_msg = f"❌ Error ingesting documents: {e}"
+            logger.error(error_msg)
+            return error_msg
+    
+    def _append_chunks(self, url: str, chunks: List[Dict[str, Any]], documents: list, metadatas: list, ids: list):
+        """Append a page's chunks to parallel ChromaDB add() argument lists."""
+        for chunk in chunks:
+            metadata = chunk.get('metadata', {})
+            
+            # Generate unique ID
+            url_meta = metadata.get('url', url)
+            chunk_idx = metadata.get('chunk_index', 0)
+            
+            documents.append(chunk.get('content', ''))
+            metadatas.append(metadata)
+            ids.append(self._generate_doc_id(url_meta, chunk_idx))
+    
     def retrieve(self, query: str, n_results: int = 5) -> str:
         """
         Retrieve relevant content based on query.
@@ -186,6 +258,15 @@ class RAGTool(BaseTool):
             if not query:
                 return "❌ Error: Query is required for retrieval."
 
+            cache_key = (self.chroma_dir, self.collection_name, normalize_query(query), n_results)
+            with _retrieve_cache_lock:
+                cached = _retrieve_cache.get(cache_key)
+                if cached is not None:
+                    _retrieve_cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.info("Using cached retrieval for query: %s", query)
+                return cached
+
             # Query the collection
             results = self._collection.query(
                 query_texts=[query],
@@ -209,8 +290,13 @@ class RAGTool(BaseTool):
                 output_parts.append(doc)
                 output_parts.append("")
             
-            logger.info(f"Retrieved {len(results['documents'][0])} results for query: {query}")
-            return "\n".join(output_parts)
+            logger.info("Retrieved %s results for query: %s", len(results['documents'][0]), query)
+            output = "\n".join(output_parts)
+            with _retrieve_cache_lock:
+                _retrieve_cache[cache_key] = output
+                if len(_retrieve_cache) > RETRIEVE_CACHE_SIZE:
+                    _retrieve_cache.popitem(last=False)
+            return output
             
         except Exception as e:
             error_msg = f"❌ Error retrieving content: {e}"
@@ -227,3 +313,16 @@ class RAGTool(BaseTool):
             return self.retrieve(query)
         else:
             return f"❌ Unknown action: {action}. Use 'ingest' or 'retrieve'."
+
+
+@lru_cache(maxsize=1)
+def get_rag_tool() -> RAGTool:
+    """
+    Shared RAGTool for the default ChromaDB store.
+
+    Every agent reads and writes the same collection, so one instance (one
+    PersistentClient and collection handle) serves them all. Sharing it also
+    keeps the ingested-URL tracker and collection handle consistent after
+    clear_collection().
+    """
+    return RAGTool()
@@ -24,6 +24,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session for robots.txt fetches (page content itself is
+# loaded through headless Chromium)
+_http_session = requests.Session()
+_http_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_http_session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 
 class ScraperToolSchema(BaseModel):
     """Input schema for ScraperTool."""
@@ -72,6 +78,7 @@ class ScraperTool(BaseTool):
     # Internal caches
     _robots_parsers: dict = {}  # Cache for robots.txt parsers
     _crawl_delays: dict = {}  # Cache for crawl-delay directives
+    _last_request_at: dict = {}  # Per-domain monotonic time of the last page load
     _content_cache: dict = {}  # In-memory cache for scraped content
 
     def __init__(self, **data):
@@ -99,12 +106,12 @@ class ScraperTool(BaseTool):
                     cache_time = datetime.fromisoformat(cached_data['timestamp'])
                     cache_age_days = (datetime.now() - cache_time).total_seconds() / 86400
                     if cache_age_days < self.cache_ttl_days:
-                        logger.info(f"Using cached content for {url} (age: {cache_age_days:.1f} days)")
+                        logger.info("Using cached content for %s (age: %.1f days)", url, cache_age_days)
                         return cached_data['chunks']
                     else:
-                        logger.info(f"Cache expired for {url} (age: {cache_age_days:.1f} days, TTL: {self.cache_ttl_days} days)")
+                        logger.info("Cache expired for %s (age: %.1f days, TTL: %s days)", url, cache_age_days, self.cache_ttl_days)
             except Exception as e:
-                logger.warning(f"Error reading cache for {url}: {e}")
+                logger.warning("Error reading cache for %s: %s", url, e)
         
         return None
 
@@ -122,11 +129,13 @@ class ScraperTool(BaseTool):
                 'timestamp': datetime.now().isoformat(),
                 'chunks': chunks
             }
+            # Compact, single write: json.dump() would stream many small chunks
+            payload = json.dumps(cache_data, ensure_ascii=False, separators=(',', ':'))
             with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Cached content for {url}")
+                f.write(payload)
+            logger.info("Cached content for %s", url)
         except Exception as e:
-            logger.warning(f"Error saving cache for {url}: {e}")
+            logger.warning("Error saving cache for %s: %s", url, e)
 
     def _parse_robots_txt(self, url: str) -> Optional[RobotExclusionRulesParser]:
         """Parse robots.txt and extract crawl-delay if present."""
@@ -137,7 +146,7 @@ class ScraperTool(BaseTool):
             robots_url = f"{parsed_url.scheme}://{domain}/robots.txt"
             try:
                 headers = {'User-Agent': self.user_agent}
-                response = requests.get(robots_url, timeout=5, headers=headers)
+                response = _http_session.get(robots_url, timeout=5, headers=headers)
                 
                 if response.status_code == 200:
                     parser = RobotExclusionRulesParser()
@@ -150,17 +159,17 @@ class ScraperTool(BaseTool):
                             try:
                                 delay = float(line.split(':')[1].strip())
                                 self._crawl_delays[domain] = delay
-                                logger.info(f"Found Crawl-delay: {delay}s for {domain}")
+                                logger.info("Found Crawl-delay: %ss for %s", delay, domain)
                             except ValueError:
                                 pass
                     
-                    logger.info(f"Successfully parsed robots.txt for {domain}")
+                    logger.info("Successfully parsed robots.txt for %s", domain)
                 else:
-                    logger.info(f"No robots.txt found for {domain} (status: {response.status_code})")
+                    logger.info("No robots.txt found for %s (status: %s)", domain, response.status_code)
                     self._robots_parsers[domain] = None
                     
             except requests.exceptions.RequestException as e:
-                logger.warning(f"Error fetching robots.txt for {domain}: {e}")
+                logger.warning("Error fetching robots.txt for %s: %s", domain, e)
                 self._robots_parsers[domain] = None
 
         return self._robots_parsers.get(domain)
@@ -172,7 +181,7 @@ class ScraperTool(BaseTool):
         if parser:
             allowed = parser.is_allowed(self.user_agent, url)
             if not allowed:
-                logger.warning(f"URL blocked by robots.txt: {url}")
+                logger.warning("URL blocked by robots.txt: %s", url)
             return allowed
         
         return True  # If no parser or robots.txt not found, assume allowed
@@ -191,6 +200,15 @@ class ScraperTool(BaseTool):
         # Use default random delay
         return random.uniform(self.min_delay, self.max_delay)
 
+    def _filter_chunks(self, chunks: List[Dict[str, Any]], keywords: List[str]) -> List[Dict[str, Any]]:
+        """Keep chunks containing at least one keyword (case-insensitive)."""
+        # Lowercase and dedupe the keywords once rather than per chunk
+        needles = tuple({k.lower() for k in keywords})
+        return [
+            chunk for chunk in chunks
+            if any(needle in chunk['content'].lower() for needle in needles)
+        ]
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -204,31 +222,33 @@ class ScraperTool(BaseTool):
         # For now, let's load cached content and apply filter if needed.
         cached_content = self._get_cached_content(url)
         if cached_content:
-            logger.info(f"Loaded {len(cached_content)} chunks from cache for {url}")
+            logger.info("Loaded %s chunks from cache for %s", len(cached_content), url)
             # Apply keyword filter to cached content if provided
             if keywords:
-                filtered = []
-                for chunk in cached_content:
-                    text_lower = chunk['content'].lower()
-                    if any(k.lower() in text_lower for k in keywords):
-                        filtered.append(chunk)
-                logger.info(f"Filtered cached content: {len(filtered)}/{len(cached_content)} chunks matched keywords {keywords}")
+                filtered = self._filter_chunks(cached_content, keywords)
+                logger.info("Filtered cached content: %s/%s chunks matched keywords %s", len(filtered), len(cached_content), keywords)
                 return filtered
             return cached_content
         
         # Check robots.txt
         if not self._is_url_allowed(url):
-            logger.warning(f"Skipping {url} due to robots.txt exclusion")
+            logger.warning("Skipping %s due to robots.txt exclusion", url)
             return []
 
-        # Respect crawl-delay
-        delay = self._get_delay_for_domain(url)
-        logger.info(f"Waiting {delay:.2f}s before scraping {url}")
-        time.sleep(delay)
+        # Respect crawl-delay: only wait for whatever part of it has not
+        # already elapsed since the last page load from this domain
+        domain = urlparse(url).netloc
+        last_request_at = self._last_request_at.get(domain)
+        if last_request_at is not None:
+            remaining = self._get_delay_for_domain(url) - (time.monotonic() - last_request_at)
+            if remaining > 0:
+                logger.info("Waiting %.2fs before scraping %s", remaining, url)
+                time.sleep(remaining)
+        self._last_request_at[domain] = time.monotonic()
 
         try:
             # Step 1: Load the web page using a headless browser (Chromium)
-            logger.info(f"Loading {url} with headless browser")
+            logger.info("Loading %s with headless browser", url)
             loader = AsyncChromiumLoader(
                 [url],
                 user_agent=self.user_agent
@@ -236,11 +256,11 @@ class ScraperTool(BaseTool):
             docs = loader.load()
 
             if not docs:
-                logger.error(f"No documents loaded from {url}")
+                logger.error("No documents loaded from %s", url)
                 return []
 
             # Step 2: Transform and clean the HTML content
-            logger.info(f"Transforming HTML content from {url}")
+            logger.info("Transforming HTML content from %s", url)
             bs_transformer = BeautifulSoupTransformer()
 
             # Extract main content tags and remove noise
@@ -277,11 +297,11 @@ class ScraperTool(BaseTool):
             # Log extracted content length for debugging
             if docs_transformed:
                 extracted_text = docs_transformed[0].page_content if docs_transformed else ""
-                logger.info(f"Extracted {len(extracted_text)} characters from {url}")
+                logger.info("Extracted %s characters from %s", len(extracted_text), url)
                 if len(extracted_text) == 0:
-                    logger.warning(f"⚠️ Zero content extracted from {url} - possible parsing issue")
+                    logger.warning("⚠️ Zero content extracted from %s - possible parsing issue", url)
             else:
-                logger.warning(f"⚠️ No documents after transformation for {url}")
+                logger.warning("⚠️ No documents after transformation for %s", url)
 
             # Extract metadata from the first document
             metadata = {
@@ -291,17 +311,17 @@ class ScraperTool(BaseTool):
             }
 
             # Step 3: Split the clean text into smaller chunks for the LLM's context window
-            logger.info(f"Splitting content into chunks (size={self.chunk_size}, overlap={self.chunk_overlap})")
+            logger.info("Splitting content into chunks (size=%s, overlap=%s)", self.chunk_size, self.chunk_overlap)
             splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
                 chunk_size=self.chunk_size,
                 chunk_overlap=self.chunk_overlap,
             )
             splits = splitter.split_documents(docs_transformed)
-            logger.info(f"Created {len(splits)} splits from extracted content")
+            logger.info("Created %s splits from extracted content", len(splits))
 
             # Fallback: If tag-based extraction produced nothing, try more permissive extraction
             if not splits or len(splits) == 0:
-                logger.warning(f"Tag-based extraction failed for {url}, trying fallback method")
+                logger.warning("Tag-based extraction failed for %s, trying fallback method", url)
 
                 # Fallback: Extract all text, only remove noise tags
                 docs_fallback = bs_transformer.transform_documents(
@@ -314,7 +334,7 @@ class ScraperTool(BaseTool):
 
                 if docs_fallback:
                     splits = splitter.split_documents(docs_fallback)
-                    logger.info(f"Fallback extraction created {len(splits)} splits")
+                    logger.info("Fallback extraction created %s splits", len(splits))
 
             # Create chunks with metadata
             chunks = []
@@ -329,34 +349,34 @@ class ScraperTool(BaseTool):
                 }
                 chunks.append(chunk_data)
             
-            logger.info(f"Successfully scraped {url}: {len(chunks)} chunks created")
+            logger.info("Successfully scraped %s: %s chunks created", url, len(chunks))
             
             # Save raw chunks to cache (before filtering, so we have full content)
             self._save_to_cache(url, chunks)
             
             # Apply keyword filter if provided
             if keywords:
-                filtered_chunks = []
-                for chunk in chunks:
-                    text_lower = chunk['content'].lower()
-                    if any(k.lower() in text_lower for k in keywords):
-                        filtered_chunks.append(chunk)
-                logger.info(f"Filtered content: {len(filtered_chunks)}/{len(chunks)} chunks matched keywords {keywords}")
+                filtered_chunks = self._filter_chunks(chunks, keywords)
+                logger.info("Filtered content: %s/%s chunks matched keywords %s", len(filtered_chunks), len(chunks), keywords)
                 return filtered_chunks
             
             return chunks
 
         except Exception as e:
-            logger.error(f"Error during scraping {url}: {type(e).__name__}: {e}")
+            logger.error("Error during scraping %s: %s: %s", url, type(e).__name__, e)
             raise
 
-    def _run(self, url: str, keywords: Optional[List[str]] = None) -> str:
+    def _run(self, url: str, keywords: Optional[List[str]] = None, max_chars: Optional[int] = None) -> str:
         """
         Main entry point for the scraper tool.
         
         Args:
             url: The URL to scrape
             keywords: Optional list of keywords. Only chunks containing at least one keyword are kept.
+            max_chars: Optional cap on the returned chunk text (headers excluded). Chunks
+                past the cap are not assembled at all, and the preview ends with the
+                page's full word and chunk counts (the full content is still cached
+                for ingestion).
             
         Returns:
             A formatted string containing the scraped content with metadata
@@ -376,7 +396,7 @@ class ScraperTool(BaseTool):
                     if not keywords:
                         keywords = None
             
-            logger.info(f"Starting scrape for {url} (keywords={keywords})")
+            logger.info("Starting scrape for %s (keywords=%s)", url, keywords)
             chunks = self._load_and_transform(url, keywords)
             
             if not chunks:
@@ -386,24 +406,43 @@ class ScraperTool(BaseTool):
             
             # Format the output for better agent consumption
             metadata = chunks[0]['metadata']
+            total_words = sum(len(chunk['content'].split()) for chunk in chunks)
             output_parts = [
                 f"# Scraped Content from: {url}",
                 f"Title: {metadata.get('source_title', 'Unknown')}",
                 f"Scraped at: {metadata.get('scraped_at', 'Unknown')}",
                 f"Total relevant chunks: {len(chunks)}",
+                f"Total words: {total_words}",
                 "",
                 "---",
                 ""
             ]
             
-            # Add all chunk content
+            # Add chunk content, stopping once the preview cap on body text is reached
+            body_chars = 0
+            truncated = False
             for i, chunk in enumerate(chunks):
-                output_parts.append(f"## Chunk {i + 1}/{len(chunks)}")
-                output_parts.append(chunk['content'])
-                output_parts.append("")
+                content = chunk['content']
+                if max_chars is not None:
+                    remaining = max_chars - body_chars
+                    if remaining <= 0:
+                        truncated = True
+                        break
+                    if len(content) > remaining:
+                        content = content[:remaining]
+                        truncated = True
+                output_parts.extend((f"## Chunk {i + 1}/{len(chunks)}", content, ""))
+                body_chars += len(content)
+                if truncated:
+                    break
             
+            if truncated:
+                output_parts.append(
+                    f"[Preview truncated at {max_chars} characters; full page has "
+                    f"{total_words} words in {len(chunks)} chunks]"
+                )
             return "\n".join(output_parts)
             
         except Exception as e:
-            logger.error(f"Failed to scrape {url} after all retries: {type(e).__name__}: {e}")
+            logger.error("Failed to scrape %s after all retries: %s: %s", url, type(e).__name__, e)
             return f"Error scraping {url}: {str(e)}"
\ No newline at end of file
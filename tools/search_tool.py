@@ -1,6 +1,10 @@
 import logging
 import requests
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 from bs4 import BeautifulSoup
 from langchain_core.tools import tool
@@ -90,11 +94,11 @@ def _google_url_search(query: str, num_results: int = 5) -> str:
                     results.append(f"{idx}. **{title}**\n   URL: {url}\n   {snippet[:150]}...\n")
             except Exception as e:
                 # Skip this result if parsing fails
-                logger.debug(f"Failed to parse result {idx}: {e}")
+                logger.debug("Failed to parse result %s: %s", idx, e)
                 continue
 
         if results:
-            logger.info(f"✅ Google search successful: found {len(results)} results")
+            logger.info("✅ Google search successful: found %s results", len(results))
             return "\n".join(results)
         else:
             # Parsing failed, likely HTML structure changed
@@ -102,12 +106,46 @@ def _google_url_search(query: str, num_results: int = 5) -> str:
             return None
 
     except requests.exceptions.RequestException as e:
-        logger.warning(f"⚠️ Google search failed (network error): {e}")
+        logger.warning("⚠️ Google search failed (network error): %s", e)
         return None
     except Exception as e:
-        logger.warning(f"⚠️ Google search failed (parsing error): {e}")
+        logger.warning("⚠️ Google search failed (parsing error): %s", e)
         return None
 
+# --- Search Result Cache ---
+# Formatted DuckDuckGo results keyed by (normalized query, num_results). Repeat
+# searches within the TTL (e.g. the same topic queued twice) skip the network.
+SEARCH_CACHE_SIZE = 256
+SEARCH_CACHE_TTL_SECONDS = 6 * 60 * 60
+_search_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+def _get_cached_search(key: tuple):
+    """Return a cached search result if present and not expired."""
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > SEARCH_CACHE_TTL_SECONDS:
+            del _search_cache[key]
+            return None
+        _search_cache.move_to_end(key)
+        return result
+
+def _store_cached_search(key: tuple, result: str):
+    """Cache a search result, evicting the least recently used entry if full."""
+    with _search_cache_lock:
+        _search_cache[key] = (time.monotonic(), result)
+        _search_cache.move_to_end(key)
+        if len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+
+def clear_search_cache():
+    """Drop all cached search results."""
+    with _search_cache_lock:
+        _search_cache.clear()
+
 # --- DuckDuckGo Search (Fallback Strategy) ---
 
 @retry(
@@ -118,16 +156,36 @@ def _google_url_search(query: str, num_results: int = 5) -> str:
 )
 def _execute_ddgs_search(query: str, max_results: int = 7) -> List[Dict]:
     """Execute DDGS search with retry logic."""
-    with DDGS() as ddgs:
-        return list(ddgs.text(query, max_results=max_results))
+    return list(_get_ddgs().text(query, max_results=max_results))
+
+_ddgs_local = threading.local()
+
+def _get_ddgs() -> DDGS:
+    """
+    DDGS client for the current thread.
+
+    DDGS caches its search-engine instances (and their HTTP clients) per
+    object, so reusing one keeps connections warm across searches. Some engines
+    keep per-query state on the instance, so each thread gets its own client.
+    """
+    ddgs = getattr(_ddgs_local, "ddgs", None)
+    if ddgs is None:
+        ddgs = _ddgs_local.ddgs = DDGS()
+    return ddgs
 
 def _duckduckgo_search(query: str, num_results: int = 4) -> str:
     """
     Search using DuckDuckGo via DDGS library.
     Returns structured results with URLs for the researcher to scrape.
     """
+    cache_key = (" ".join(query.lower().split()), num_results)
+    cached = _get_cached_search(cache_key)
+    if cached is not None:
+        logger.info("Using cached DuckDuckGo results for: %s", query)
+        return cached
+
     try:
-        logger.info(f"Searching DuckDuckGo for: {query}")
+        logger.info("Searching DuckDuckGo for: %s", query)
 
         # Use DDGS directly for structured results with URLs
         raw_results = _execute_ddgs_search(query, max_results=num_results)
@@ -149,11 +207,13 @@ def _duckduckgo_search(query: str, num_results: int = 4) -> str:
                 f"   {snippet}...\n"
             )
 
-        logger.info(f"DuckDuckGo search successful: found {len(formatted_results)} results")
-        return "\n".join(formatted_results)
+        logger.info("DuckDuckGo search successful: found %s results", len(formatted_results))
+        result = "\n".join(formatted_results)
+        _store_cached_search(cache_key, result)
+        return result
 
     except Exception as e:
-        logger.error(f"DuckDuckGo search failed: {e}")
+        logger.error("DuckDuckGo search failed: %s", e)
         return f"Error: Search failed. {str(e)}"
 
 # --- Hybrid Search Tool ---
@@ -172,7 +232,35 @@ def web_search(query: str) -> str:
     Returns:
         A string containing search results with titles, snippets, and URLs.
     """
-    logger.info(f"Searching for: {query}")
+    logger.info("Searching for: %s", query)
 
     # Use DuckDuckGo directly (Google scraping is blocked)
     return _duckduckgo_search(query)
+
+# Concurrent DuckDuckGo requests for web_search_many (kept low to avoid rate limiting)
+MAX_PARALLEL_SEARCHES = 4
+
+@tool
+def web_search_many(queries: List[str]) -> str:
+    """
+    Run several web searches at once and return all results with URLs.
+
+    Prefer this over calling web_search repeatedly: the searches run
+    concurrently in a single step.
+
+    Args:
+        queries: Distinct search queries (e.g., ["coffee brewing guide", "coffee brewing statistics"])
+
+    Returns:
+        Search results for each query, in the order given.
+    """
+    queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+    logger.info("Searching for %s queries: %s", len(queries), queries)
+
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_SEARCHES) as executor:
+        results = executor.map(_duckduckgo_search, queries)
+
+    return "\n\n".join(
+        f"## Results for: {query}\n\n{result}"
+        for query, result in zip(queries, results)
+    )